@@ -8,18 +8,53 @@ specialized domain expertise.
 """
 
 import logging
-import os
-import yaml
+import re
+from typing import TYPE_CHECKING, Any, Tuple
 
-from strands import Agent
-from strands_tools import memory, file_read, file_write, editor, calculator
-from base import BaseAgent, ollama_query
-config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-with open(config_path, 'r') as file:
-    config = yaml.safe_load(file)   
+from .base import BaseAgent
+from .swarm_config import get_prompt
+
+if TYPE_CHECKING:
+    from strands import Agent
 
 logger = logging.getLogger(__name__)
 
+# Simple heuristics for coordination decisions
+COORDINATION_KEYWORDS = (
+    "research and", "analyze and create", "find and validate",
+    "calculate and explain", "search and summarize",
+    "create and test", "design and implement"
+)
+
+SPECIALIST_KEYWORDS = (
+    "coordinate", "orchestrate", "manage", "oversee",
+    "synthesize", "integrate", "combine", "merge"
+)
+
+_COORDINATION = "coordination"
+_SPECIALIST = "specialist"
+
+def _build_keyword_matcher():
+    """Compile both keyword sets into one matcher that scans a task in a single pass"""
+    tags = {keyword: _COORDINATION for keyword in COORDINATION_KEYWORDS}
+    for keyword in SPECIALIST_KEYWORDS:
+        tags.setdefault(keyword, _SPECIALIST)
+    
+    try:
+        import ahocorasick
+    except ImportError:
+        # Lookahead alternation reports overlapping matches, like the automaton
+        pattern = re.compile("(?=(" + "|".join(map(re.escape, tags)) + "))")
+        return lambda text: (tags[match.group(1)] for match in pattern.finditer(text))
+    
+    automaton = ahocorasick.Automaton()
+    for keyword, tag in tags.items():
+        automaton.add_word(keyword, tag)
+    automaton.make_automaton()
+    return lambda text: (tag for _, tag in automaton.iter(text))
+
+_match_keywords = _build_keyword_matcher()
+
 class HyniclAgent(BaseAgent):
     """
     Hynicl Agent - Master Coordinator with specialized capabilities
@@ -33,48 +68,44 @@ class HyniclAgent(BaseAgent):
         self.coordination_mode = True
         self.specialist_mode = True
     
-    def create_agent(self) -> Agent:
+    @classmethod
+    def load_tools(cls) -> Tuple[Any, ...]:
+        """Import the Strands tools this agent registers"""
+        from strands_tools import memory, file_read, file_write, editor, calculator
+        from .swarm_tools import ollama_query
+        
+        return (
+            memory,           # Shared memory access
+            ollama_query,     # Direct Ollama access
+            file_read,        # File operations
+            file_write,
+            editor,
+            calculator        # Computational tools
+        )
+    
+    def create_agent(self) -> "Agent":
         """Create the Hynicl Agent with master coordination capabilities"""
+        from strands import Agent
 
-        system_prompt = config['Prompt']['hynicl_agent_prompt']
+        system_prompt = get_prompt(self.name)
 
         return Agent(
             name=self.name,
             model=self.ollama_model,
             system_prompt=system_prompt,
-            tools=[
-                memory,           # Shared memory access
-                ollama_query,     # Direct Ollama access
-                file_read,        # File operations
-                file_write,
-                editor,
-                calculator        # Computational tools
-            ]
+            tools=list(self.get_tools())
         )
     
     def get_coordination_strategy(self, task: str) -> str:
         """Analyze task and determine coordination strategy"""
         
-        # Simple heuristics for coordination decisions
-        coordination_keywords = [
-            "research and", "analyze and create", "find and validate", 
-            "calculate and explain", "search and summarize",
-            "create and test", "design and implement"
-        ]
-        
-        specialist_keywords = [
-            "coordinate", "orchestrate", "manage", "oversee",
-            "synthesize", "integrate", "combine", "merge"
-        ]
-        
-        task_lower = task.lower()
-        
-        needs_coordination = any(keyword in task_lower for keyword in coordination_keywords)
-        is_specialist_task = any(keyword in task_lower for keyword in specialist_keywords)
+        is_specialist_task = False
+        for tag in _match_keywords(task.lower()):
+            if tag == _COORDINATION:
+                return "multi_agent_coordination"
+            is_specialist_task = True
         
-        if needs_coordination:
-            return "multi_agent_coordination"
-        elif is_specialist_task:
+        if is_specialist_task:
             return "specialist_direct"
         else:
             return "assess_complexity"
@@ -83,7 +114,7 @@ class HyniclAgent(BaseAgent):
         """Execute task in master coordination mode"""
         strategy = self.get_coordination_strategy(task)
         
-        logger.info(f"Hynicl Master executing with strategy: {strategy}")
+        logger.info("Hynicl Master executing with strategy: %s", strategy)
         
         if strategy == "multi_agent_coordination":
             return f"[COORDINATION MODE] Analyzing task for multi-agent delegation: {task}"
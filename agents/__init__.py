@@ -3,28 +3,67 @@
 Multi-Agent Swarm Package
 
 This package contains all the specialized agents for the multi-agent swarm system.
+Names are imported on first access, so `import agents` does not load Strands.
+A daemon thread warms the config and Strands imports in the background
+(set AGENTS_PREWARM=0 to disable).
 """
 
-# Import all agent creation functions for easy access
-from .hynicl_agent import create_hynicl_agent
-from .search_agent import create_search_agent  
-from .reasoning_agent import create_reasoning_agent
-from .tool_agent import create_tool_agent
-from .validation_agent import create_validation_agent
-
-# Import base classes and utilities
-from .base import BaseAgent, OllamaClient, SwarmConfig, ollama_query, web_search, code_execution
-
-__all__ = [
-    'create_hynicl_agent',
-    'create_search_agent', 
-    'create_reasoning_agent',
-    'create_tool_agent',
-    'create_validation_agent',
-    'BaseAgent',
-    'OllamaClient', 
-    'SwarmConfig',
-    'ollama_query',
-    'web_search',
-    'code_execution'
-]
\ No newline at end of file
+import importlib
+import logging
+import os
+import threading
+
+# Public name -> submodule that defines it
+_LAZY_IMPORTS = {
+    'create_hynicl_agent': 'Hynicl_agent',
+    'create_search_agent': 'search_agent',
+    'create_reasoning_agent': 'reasoning_agent',
+    'create_tool_agent': 'tool_agent',
+    'create_validation_agent': 'validation_agent',
+    'BaseAgent': 'base',
+    'OllamaClient': 'base',
+    'SwarmConfig': 'base',
+    'ollama_query': 'swarm_tools',
+    'web_search': 'swarm_tools',
+    'code_execution': 'swarm_tools'
+}
+
+__all__ = list(_LAZY_IMPORTS)
+
+# Modules the first create_*_agent() call would otherwise import on the spot
+_PREWARM_MODULES = (
+    'strands',
+    'strands.models.ollama',
+    'strands.multiagent',
+    'strands_tools.memory',
+    'strands_tools.calculator',
+    'strands_tools.file_read',
+    'strands_tools.file_write',
+    'strands_tools.editor',
+    '.swarm_tools'
+)
+
+def __getattr__(name):
+    """Import the module defining `name` on first access"""
+    module_name = _LAZY_IMPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_IMPORTS))
+
+def _prewarm():
+    """Parse the config and import Strands ahead of the first agent creation"""
+    try:
+        importlib.import_module('.swarm_config', __name__).get_prompts()
+        for module_name in _PREWARM_MODULES:
+            importlib.import_module(module_name, __name__)
+    except Exception as e:
+        # The first real use will hit (and report) the same error
+        logging.getLogger(__name__).debug(f"Prewarm stopped early: {e}")
+
+if os.environ.get('AGENTS_PREWARM', '1') != '0':
+    threading.Thread(target=_prewarm, name='agents-prewarm', daemon=True).start()
@@ -3,131 +3,378 @@
 Multi-Agent Swarm Base Classes and Utilities
 """
 
-import json
-import requests
+import asyncio
+import orjson
+import hashlib
 import logging
-import yaml
+import threading
+import time
 import os
-from typing import Dict, Any, Optional, List
-from strands import Agent, tool
-from strands.models.ollama import OllamaModel
-from strands.multiagent import Swarm
-from strands_tools import file_read, file_write, editor, memory, calculator
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Dict, Any, Mapping, Optional, List, NamedTuple, Set, Tuple, Union
+from . import yaml_config
+from .swarm_config import CONFIG_PATH, get_config
+from .ollama_http import OllamaClient, AsyncOllamaClient, OllamaSemaphorePool, RoundRobinOllama
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(levelname)s | %(name)s | %(message)s")
 logger = logging.getLogger(__name__)
 
+if TYPE_CHECKING:
+    from strands import Agent
+    from strands.models.ollama import OllamaModel
+
 # Enable debug logs for multi-agent operations
 logging.getLogger("strands.multiagent").setLevel(logging.DEBUG)
 
-class OllamaClient:
-    """Enhanced client for communicating with Ollama local model"""
+# Strands tools moved to swarm_tools.py; `from agents.base import ollama_query` still works
+_TOOL_NAMES = frozenset({"ollama_query", "web_search", "code_execution"})
+
+def __getattr__(name: str) -> Any:
+    """Resolve the tool functions from swarm_tools.py on first access"""
+    if name in _TOOL_NAMES:
+        from . import swarm_tools
+        return getattr(swarm_tools, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+class _CacheEntry(NamedTuple):
+    response: str
+    created: float
+    scope: Tuple[str, bool]
+    vector: Any
+
+
+class OllamaCache:
+    """LRU + TTL response cache with an optional semantic (embedding) tier"""
     
-    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.2:1b"):
-        self.base_url = base_url
-        self.model = model
-        self.headers = {"Content-Type": "application/json"}
+    def __init__(self, max_entries: int = 256, ttl: float = 3600.0, semantic: bool = False,
+                 similarity_threshold: float = 0.92, embed_model: Optional[str] = None):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.similarity_threshold = similarity_threshold
+        self.embed_model = embed_model
+        self.np = None
+        
+        if semantic:
+            try:
+                import numpy
+                self.np = numpy
+            except ImportError:
+                logger.warning("numpy is not installed - semantic cache tier disabled")
+        
+        self._entries: "OrderedDict[str, _CacheEntry]" = OrderedDict()
+        self._index: Dict[Tuple[str, bool], Tuple[List[str], Any, Any]] = {}
+        self._lock = threading.Lock()
     
-    def generate(self, prompt: str, stream: bool = False) -> Dict[str, Any]:
-        """Generate response from Ollama model"""
-        url = f"{self.base_url}/api/generate"
-        data = {
-            "model": self.model,
-            "prompt": prompt,
-            "stream": stream
-        }
+    @property
+    def semantic(self) -> bool:
+        """Whether lookups can fall back to embedding similarity"""
+        return self.np is not None
+    
+    @staticmethod
+    def make_key(model: str, prompt: str, use_chat: bool) -> str:
+        """Exact-match key for a query"""
+        payload = orjson.dumps({"model": model, "prompt": prompt, "use_chat": use_chat}, option=orjson.OPT_SORT_KEYS)
+        return hashlib.sha256(payload).hexdigest()
+    
+    def get(self, model: str, prompt: str, use_chat: bool,
+            embedding: Optional[List[float]] = None) -> Optional[str]:
+        """Return a cached response for an identical or similar prompt"""
+        key = self.make_key(model, prompt, use_chat)
+        now = time.monotonic()
         
-        try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(data))
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error communicating with Ollama: {e}")
-            return {"error": str(e)}
-    
-    def chat(self, messages: list, stream: bool = False) -> Dict[str, Any]:
+        with self._lock:
+            entry = self._lookup(key, now)
+            if entry is not None:
+                return entry.response
+            
+            if not self.semantic or embedding is None:
+                return None
+            
+            keys, matrix, created = self._scope_index((model, use_chat))
+            if not keys:
+                return None
+            
+            # Vectors are unit length, so one GEMV gives every cosine similarity;
+            # expired entries stay in the index until evicted, so mask them out
+            scores = matrix @ self._normalize(embedding)
+            scores[now - created > self.ttl] = -self.np.inf
+            best = int(scores.argmax())
+            if scores[best] < self.similarity_threshold:
+                return None
+            
+            entry = self._lookup(keys[best], now)
+            return entry.response if entry is not None else None
+    
+    def put(self, model: str, prompt: str, use_chat: bool, response: str,
+            embedding: Optional[List[float]] = None):
+        """Store a response, evicting the least recently used entries"""
+        key = self.make_key(model, prompt, use_chat)
+        vector = self._normalize(embedding) if self.semantic and embedding is not None else None
+        
+        with self._lock:
+            self._entries[key] = _CacheEntry(response, time.monotonic(), (model, use_chat), vector)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+            self._index.clear()
+    
+    def clear(self):
+        """Drop every cached response"""
+        with self._lock:
+            self._entries.clear()
+            self._index.clear()
+    
+    def _lookup(self, key: str, now: float) -> Optional[_CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if now - entry.created > self.ttl:
+            del self._entries[key]
+            self._index.clear()
+            return None
+        self._entries.move_to_end(key)
+        return entry
+    
+    def _scope_index(self, scope: Tuple[str, bool]) -> Tuple[List[str], Any, Any]:
+        # Rebuilt lazily after any insert/evict, then reused across lookups
+        if scope not in self._index:
+            keys = [key for key, entry in self._entries.items()
+                    if entry.scope == scope and entry.vector is not None]
+            matrix = self.np.vstack([self._entries[key].vector for key in keys]) if keys else None
+            created = self.np.array([self._entries[key].created for key in keys])
+            self._index[scope] = (keys, matrix, created)
+        return self._index[scope]
+    
+    def _normalize(self, embedding: List[float]) -> Any:
+        vector = self.np.asarray(embedding, dtype=self.np.float32)
+        norm = self.np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+class _BatchItem(NamedTuple):
+    kind: str
+    args: tuple
+    future: "asyncio.Future"
+
+
+class BatchingOllamaClient:
+    """Coalesce concurrent Ollama calls into micro-batches on a background event loop"""
+    
+    def __init__(self, backend: Union[AsyncOllamaClient, RoundRobinOllama],
+                 max_batch_size: int = 8, max_wait: float = 0.02):
+        self.backend = backend
+        self.model = backend.model
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        
+        # The loop lives as long as the client and owns the backend's aiohttp sessions
+        self._loop = asyncio.new_event_loop()
+        self._queue: Optional[asyncio.Queue] = None
+        # The loop only keeps weak references to tasks; hold in-flight dispatches here
+        self._dispatches: Set["asyncio.Task"] = set()
+        ready = threading.Event()
+        self._thread = threading.Thread(target=self._run_loop, args=(ready,), name="ollama-batcher", daemon=True)
+        self._thread.start()
+        ready.wait()
+    
+    async def generate(self, prompt: str) -> Dict[str, Any]:
+        """Generate response from Ollama model"""
+        return await self._submit("generate", prompt)
+    
+    async def chat(self, messages: list) -> Dict[str, Any]:
         """Chat with Ollama model using message history"""
-        url = f"{self.base_url}/api/chat"
-        data = {
-            "model": self.model,
-            "messages": messages,
-            "stream": stream
-        }
+        return await self._submit("chat", messages)
+    
+    async def embed(self, inputs: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        """Embed inputs, merged with other pending embed calls for the same model"""
+        return await self._submit("embed", inputs, model)
+    
+    async def list_models(self) -> Dict[str, Any]:
+        """List available Ollama models"""
+        return await self._submit("list_models")
+    
+    def close(self):
+        """Stop the batching loop and close the backend sessions"""
+        if self._loop.is_running():
+            asyncio.run_coroutine_threadsafe(self._shutdown(), self._loop).result()
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+    
+    async def _submit(self, kind: str, *args) -> Dict[str, Any]:
+        # Callers may run on any event loop; hop onto ours and await the result
+        future = asyncio.run_coroutine_threadsafe(self._enqueue(kind, args), self._loop)
+        return await asyncio.wrap_future(future)
+    
+    async def _enqueue(self, kind: str, args: tuple) -> Dict[str, Any]:
+        future = self._loop.create_future()
+        await self._queue.put(_BatchItem(kind, args, future))
+        return await future
+    
+    async def _shutdown(self):
+        self._drainer.cancel()
+        try:
+            await self._drainer
+        except asyncio.CancelledError:
+            pass
+        await self.backend.close()
+    
+    def _run_loop(self, ready: threading.Event):
+        asyncio.set_event_loop(self._loop)
+        self._queue = asyncio.Queue()
+        self._drainer = self._loop.create_task(self._drain())
+        self._loop.call_soon(ready.set)
+        self._loop.run_forever()
+    
+    async def _drain(self):
+        while True:
+            batch = [await self._queue.get()]
+            deadline = self._loop.time() + self.max_wait
+            
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - self._loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+            
+            # Dispatch without blocking the drain so the next batch can form
+            task = self._loop.create_task(self._dispatch(batch))
+            self._dispatches.add(task)
+            task.add_done_callback(self._dispatches.discard)
+    
+    async def _dispatch(self, batch: List[_BatchItem]):
+        try:
+            embeds: Dict[Optional[str], List[_BatchItem]] = {}
+            calls = []
+            for item in batch:
+                if item.kind == "embed":
+                    embeds.setdefault(item.args[1], []).append(item)
+                else:
+                    calls.append(self._call(item))
+            
+            for model, items in embeds.items():
+                calls.append(self._embed_batch(model, items))
+            
+            await asyncio.gather(*calls)
+        except Exception as e:
+            # Never leave a caller waiting on a batch that failed
+            self._fail(batch, e)
+    
+    @staticmethod
+    def _fail(items: List[_BatchItem], error: Exception):
+        """Raise error in every caller that is still waiting"""
+        for item in items:
+            if not item.future.done():
+                item.future.set_exception(error)
+    
+    def _run_for(self, coro: Any, items: List[_BatchItem]) -> "asyncio.Task":
+        """Run a backend call as a task, cancelled once every waiting caller gives up"""
+        task = self._loop.create_task(coro)
+        
+        def cancel_if_abandoned(_future: "asyncio.Future"):
+            if all(item.future.cancelled() for item in items):
+                task.cancel()
         
+        for item in items:
+            item.future.add_done_callback(cancel_if_abandoned)
+        return task
+    
+    async def _call(self, item: _BatchItem):
+        # Cancelled (e.g. a node timeout) while still queued
+        if item.future.done():
+            return
         try:
-            response = requests.post(url, headers=self.headers, data=json.dumps(data))
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error communicating with Ollama: {e}")
-            return {"error": str(e)}
-    
-    def list_models(self) -> Dict[str, Any]:
-        """List available Ollama models"""
-        url = f"{self.base_url}/api/tags"
+            result = await self._run_for(getattr(self.backend, item.kind)(*item.args), [item])
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            if not item.future.done():
+                item.future.set_exception(e)
+            return
+        if not item.future.done():
+            item.future.set_result(result)
+    
+    async def _embed_batch(self, model: Optional[str], items: List[_BatchItem]):
+        # One /api/embed request for every pending input, split back per caller
+        if all(item.future.done() for item in items):
+            return
+        inputs = [text for item in items for text in item.args[0]]
+        try:
+            result = await self._run_for(self.backend.embed(inputs, model), items)
+        except asyncio.CancelledError:
+            return
+        except Exception as e:
+            self._fail(items, e)
+            return
         
+        # Cancelled callers still own their slice of the offsets
         try:
-            response = requests.get(url)
-            response.raise_for_status()
-            return response.json()
-        except requests.exceptions.RequestException as e:
-            logger.error(f"Error listing models: {e}")
-            return {"error": str(e)}
+            offset = 0
+            for item in items:
+                count = len(item.args[0])
+                if not item.future.done():
+                    if "error" in result:
+                        item.future.set_result(result)
+                    else:
+                        item.future.set_result({**result, "embeddings": result["embeddings"][offset:offset + count]})
+                offset += count
+        except Exception as e:
+            # e.g. a 200 response without "embeddings"
+            self._fail(items, e)
 
 # Global Ollama client instance
 ollama_client = None
 
-@tool
-def ollama_query(prompt: str, use_chat: bool = False) -> str:
-    """
-    Query the Ollama model with a prompt
-    
-    Args:
-        prompt: The prompt to send to the model
-        use_chat: Whether to use chat format or generate format
-    
-    Returns:
-        str: The model's response
-    """
-    if use_chat:
-        messages = [{"role": "user", "content": prompt}]
-        result = ollama_client.chat(messages)
-        if "error" in result:
-            return f"Error: {result['error']}"
-        return result.get("message", {}).get("content", "No response received")
-    else:
-        result = ollama_client.generate(prompt)
-        if "error" in result:
-            return f"Error: {result['error']}"
-        return result.get("response", "No response received")
-
-@tool
-def web_search(query: str) -> str:
-    """Simulate web search functionality"""
-    return f"Search results for '{query}': [Simulated search results would appear here]"
-
-@tool  
-def code_execution(code: str, language: str = "python") -> str:
-    """Execute code safely in a sandboxed environment"""
-    return f"Code execution result: [Simulated execution of {language} code]"
+# Global response cache (None when caching is disabled)
+ollama_cache = None
+
+@dataclass(slots=True, frozen=True)
+class SwarmParams:
+    """Swarm limits unpacked once from the 'swarm' config section"""
+    max_handoffs: int
+    max_iterations: int
+    execution_timeout: float
+    node_timeout: float
+    repetitive_handoff_detection_window: int
+    repetitive_handoff_min_unique_agents: int
+    
+    @classmethod
+    def from_config(cls, swarm_config: Dict[str, Any]) -> "SwarmParams":
+        """Build from the 'swarm' section of config.yml"""
+        return cls(
+            max_handoffs=swarm_config["max_handoffs"],
+            max_iterations=swarm_config["max_iterations"],
+            execution_timeout=swarm_config["execution_timeout"],
+            node_timeout=swarm_config["node_timeout"],
+            repetitive_handoff_detection_window=swarm_config["repetitive_handoff_detection_window"],
+            repetitive_handoff_min_unique_agents=swarm_config["repetitive_handoff_min_unique_agents"]
+        )
 
 class SwarmConfig:
     """Configuration management for the swarm"""
     
     def __init__(self, config_path: str = None):
         if config_path is None:
-            # Default to config.yml in the project root (parent of agents directory)
-            config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
+            config_path = CONFIG_PATH
         self.config_path = config_path
         self.config = self.load_config()
     
-    def load_config(self) -> Dict[str, Any]:
+    def load_config(self) -> Mapping[str, Any]:
         """Load configuration from YAML file"""
         try:
+            if os.path.abspath(self.config_path) == os.path.abspath(CONFIG_PATH):
+                # Shared with the agents; prefers a baked _config_generated.py,
+                # which also stands in for a missing config.yml
+                try:
+                    return get_config()
+                except FileNotFoundError:
+                    return self.create_default_config()
             if os.path.exists(self.config_path):
-                with open(self.config_path, 'r') as f:
-                    return yaml.safe_load(f)
+                return yaml_config.load_config(self.config_path)
             else:
                 return self.create_default_config()
         except Exception as e:
@@ -141,7 +388,9 @@ class SwarmConfig:
                 "host": "http://localhost:11434",
                 "default_model": "llama3.2:1b",
                 "temperature": 0.7,
-                "keep_alive": "10m"
+                "keep_alive": "10m",
+                "local_concurrency": 1,
+                "remote_concurrency": 4
             },
             "swarm": {
                 "max_handoffs": 25,
@@ -150,12 +399,26 @@ class SwarmConfig:
                 "node_timeout": 300.0,        # 5 minutes per agent
                 "repetitive_handoff_detection_window": 8,
                 "repetitive_handoff_min_unique_agents": 3
+            },
+            "cache": {
+                "enabled": False,
+                "max_entries": 256,
+                "ttl": 3600.0,
+                "semantic": False,
+                "similarity_threshold": 0.92,
+                "embed_model": "nomic-embed-text"
+            },
+            "batching": {
+                "enabled": True,
+                "max_batch_size": 8,
+                "max_wait": 0.02
             }
         }
         
         try:
             # Ensure the directory exists before writing
             os.makedirs(os.path.dirname(self.config_path), exist_ok=True)
+            import yaml
             with open(self.config_path, 'w') as f:
                 yaml.dump(default_config, f, default_flow_style=False)
             logger.info(f"Created default config at {self.config_path}")
@@ -167,16 +430,32 @@ class SwarmConfig:
 class BaseAgent:
     """Base class for all specialized agents"""
     
-    def __init__(self, name: str, ollama_model: OllamaModel):
+    def __init__(self, name: str, ollama_model: "OllamaModel"):
         self.name = name
         self.ollama_model = ollama_model
         self.agent = None
     
-    def create_agent(self) -> Agent:
+    # Tools each subclass registers, imported once on first use by get_tools()
+    TOOLS: Optional[Tuple[Any, ...]] = None
+    
+    @classmethod
+    def load_tools(cls) -> Tuple[Any, ...]:
+        """Import the subclass's Strands tools - override to register tools"""
+        return ()
+    
+    @classmethod
+    def get_tools(cls) -> Tuple[Any, ...]:
+        """Return the subclass's tool tuple, loading it on first call"""
+        tools = cls.__dict__.get("TOOLS")
+        if tools is None:
+            tools = cls.TOOLS = cls.load_tools()
+        return tools
+    
+    def create_agent(self) -> "Agent":
         """Create the Strands agent - to be implemented by subclasses"""
         raise NotImplementedError("Subclasses must implement create_agent method")
     
-    def get_agent(self) -> Agent:
+    def get_agent(self) -> "Agent":
         """Get the created agent instance"""
         if self.agent is None:
             self.agent = self.create_agent()
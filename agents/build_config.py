@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Config Code Generator
+
+Bakes config.yml into agents/_config_generated.py as a Python literal, so a
+deployed swarm loads its config from a compiled .pyc without parsing YAML.
+Run it whenever config.yml changes (e.g. while building a deployment image):
+
+    python agents/build_config.py    (or: python -m agents.build_config)
+"""
+
+import os
+import pprint
+import sys
+
+# Make the agents package importable when run as a script
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
+
+# A one-shot build has no use for the package's background prewarm
+os.environ.setdefault('AGENTS_PREWARM', '0')
+
+from agents.yaml_config import get_loader, source_hash
+from agents.swarm_config import CONFIG_PATH
+
+GENERATED_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '_config_generated.py')
+
+def render(source: bytes) -> str:
+    """Python source for the generated module"""
+    import yaml
+    config = yaml.load(source, Loader=get_loader())
+    return (
+        "# Generated by agents/build_config.py from config.yml - do not edit\n"
+        f"SOURCE_HASH = {source_hash(source)!r}\n"
+        f"CONFIG = {pprint.pformat(config, width=100, sort_dicts=False)}\n"
+    )
+
+def build(config_path: str = CONFIG_PATH, output_path: str = GENERATED_PATH) -> None:
+    """Write the generated module for config_path"""
+    with open(config_path, 'rb') as f:
+        source = f.read()
+
+    tmp_path = f"{output_path}.{os.getpid()}.tmp"
+    with open(tmp_path, 'w') as f:
+        f.write(render(source))
+    os.replace(tmp_path, output_path)
+    print(f"Wrote {output_path}")
+
+if __name__ == "__main__":
+    build(*sys.argv[1:2])
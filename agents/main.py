@@ -5,34 +5,78 @@ Multi-Agent Swarm Main Orchestrator
 This is the main entry point for the multi-agent swarm system.
 """
 
+import asyncio
 import logging
 import sys
 import os
+from operator import attrgetter
 from typing import Dict, Any
 
-# Add agents directory to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'agents'))
+# Make the agents package importable when run as a script (python main.py)
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if PROJECT_ROOT not in sys.path:
+    sys.path.insert(0, PROJECT_ROOT)
 
-from hynicl_agent import create_hynicl_agent
-from search_agent import create_search_agent
-from reasoning_agent import create_reasoning_agent
-from tool_agent import create_tool_agent
-from validation_agent import create_validation_agent
-from base import SwarmConfig, OllamaClient
-
-from strands.models.ollama import OllamaModel
-from strands.multiagent import Swarm
+# Importing the package starts its background prewarm (config + Strands), so
+# the Strands imports are deferred into initialize_ollama and create_swarm
+from agents import base
+from agents.Hynicl_agent import create_hynicl_agent
+from agents.search_agent import create_search_agent
+from agents.reasoning_agent import create_reasoning_agent
+from agents.tool_agent import create_tool_agent
+from agents.validation_agent import create_validation_agent
+from agents.base import (
+    SwarmConfig, SwarmParams, OllamaClient, OllamaCache, BatchingOllamaClient,
+    AsyncOllamaClient, OllamaSemaphorePool, RoundRobinOllama
+)
 
 logger = logging.getLogger(__name__)
 
+# Interactive inputs that end the session
+QUIT_COMMANDS = frozenset({'quit', 'exit', 'q'})
+
+# Reads node_id off SwarmResult.node_history entries in C
+node_id = attrgetter('node_id')
+
+# Swarm members in node order; hynicl first as the entry point
+AGENT_NAMES = ("hynicl", "search", "reasoning", "tool", "validation")
+
 class MultiAgentSwarm:
     """Main orchestrator for the multi-agent swarm"""
     
+    # Static command output, rendered once and written with a single call
+    HELP_TEXT = "\n".join([
+        "\n📚 HYNICL SWARM COMMANDS:",
+        "• Direct task description - Hynicl will coordinate agents automatically",
+        "• 'agents' - Show available agents and roles",
+        "• 'config' - Show current swarm configuration",
+        "• 'models' - Show available Ollama models ('models refresh' to re-query)",
+        "• 'help' - Show this help message",
+        "• 'quit' - Exit the swarm",
+        "\n💡 EXAMPLE TASKS:",
+        "• 'Research quantum computing and create a technical report'",
+        "• 'Search for Python best practices and validate the information'",
+        "• 'Analyze this dataset and implement visualization code'",
+        "• 'Find information about AI ethics and reason through the implications'"
+    ]) + "\n"
+    
+    AGENTS_TEXT = "\n".join([
+        "\n🤖 HYNICL SWARM AGENTS:",
+        "• HYNICL (Master): Coordinates swarm + domain expertise",
+        "• SEARCH: Web search and information retrieval",
+        "• REASONING: Logic analysis and decision making",
+        "• TOOL: Technical implementation and file operations",
+        "• VALIDATION: Quality assurance and verification"
+    ]) + "\n"
+    
     def __init__(self):
         self.config = SwarmConfig()
+        self._config_text = self.render_config()
+        self.swarm_params = SwarmParams.from_config(self.config.config["swarm"])
         self.ollama_client = None
         self.ollama_model = None
         self.agents = {}
+        self._agent_list = ()
         self.swarm = None
         
         self.initialize_ollama()
@@ -41,8 +85,6 @@ class MultiAgentSwarm:
     
     def initialize_ollama(self):
         """Initialize Ollama client and model"""
-        from base import ollama_client
-        
         ollama_config = self.config.config["ollama"]
         
         # Initialize Ollama client
@@ -51,9 +93,46 @@ class MultiAgentSwarm:
             model=ollama_config["default_model"]
         )
         
-        # Set global client for tools
-        import base
-        base.ollama_client = self.ollama_client
+        # Async backend for tools, round-robin over every configured host
+        hosts = ollama_config.get("hosts") or [ollama_config["host"]]
+        backend = RoundRobinOllama(
+            [
+                AsyncOllamaClient(
+                    base_url=host,
+                    model=ollama_config["default_model"],
+                    connection_limit=len(AGENT_NAMES) * 2,
+                    unix_socket=ollama_config.get("unix_socket")
+                )
+                for host in hosts
+            ],
+            OllamaSemaphorePool(
+                local_limit=ollama_config.get("local_concurrency", 1),
+                remote_limit=ollama_config.get("remote_concurrency", 4)
+            )
+        )
+        
+        # Set global client for tools; it owns the event loop the backend runs on,
+        # so it is used even when batching is off (one-item batches, no wait)
+        batching_config = self.config.config.get("batching", {})
+        if batching_config.get("enabled"):
+            base.ollama_client = BatchingOllamaClient(
+                backend,
+                max_batch_size=batching_config.get("max_batch_size", 8),
+                max_wait=batching_config.get("max_wait", 0.02)
+            )
+        else:
+            base.ollama_client = BatchingOllamaClient(backend, max_batch_size=1, max_wait=0)
+        
+        # Optional response cache shared by every ollama_query call
+        cache_config = self.config.config.get("cache", {})
+        if cache_config.get("enabled"):
+            base.ollama_cache = OllamaCache(
+                max_entries=cache_config.get("max_entries", 256),
+                ttl=cache_config.get("ttl", 3600.0),
+                semantic=cache_config.get("semantic", False),
+                similarity_threshold=cache_config.get("similarity_threshold", 0.92),
+                embed_model=cache_config.get("embed_model")
+            )
         
         # Test connection
         logger.info("Testing Ollama connection...")
@@ -62,9 +141,12 @@ class MultiAgentSwarm:
             logger.error(f"Cannot connect to Ollama: {models['error']}")
             raise ConnectionError("Make sure Ollama is running on localhost:11434")
         
-        logger.info(f"Available models: {[model['name'] for model in models.get('models', [])]}")
+        # Only build the name list when the record will actually be emitted
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Available models: {[model['name'] for model in models.get('models', [])]}")
         
         # Create Ollama model instance
+        from strands.models.ollama import OllamaModel
         self.ollama_model = OllamaModel(
             host=ollama_config["host"],
             model_id=ollama_config["default_model"],
@@ -77,51 +159,63 @@ class MultiAgentSwarm:
         
         logger.info("Creating specialized agents...")
         
-        # Create each agent using their factory functions
-        self.agents["hynicl"] = create_hynicl_agent(self.ollama_model)
-        self.agents["search"] = create_search_agent(self.ollama_model)
-        self.agents["reasoning"] = create_reasoning_agent(self.ollama_model)
-        self.agents["tool"] = create_tool_agent(self.ollama_model)
-        self.agents["validation"] = create_validation_agent(self.ollama_model)
+        # Create each agent using their factory functions; the tuple is the swarm's
+        # node order and the dict is a by-name view
+        self._agent_list = (
+            create_hynicl_agent(self.ollama_model),
+            create_search_agent(self.ollama_model),
+            create_reasoning_agent(self.ollama_model),
+            create_tool_agent(self.ollama_model),
+            create_validation_agent(self.ollama_model)
+        )
+        self.agents = dict(zip(AGENT_NAMES, self._agent_list))
         
-        logger.info(f"Created {len(self.agents)} specialized agents")
-        logger.info(f"Agents: {list(self.agents.keys())}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Created {len(self.agents)} specialized agents")
+            logger.info(f"Agents: {list(self.agents.keys())}")
     
     def create_swarm(self):
         """Create the swarm with all agents"""
-        swarm_config = self.config.config["swarm"]
-        
-        # Convert agents dict to list for swarm
-        agent_list = list(self.agents.values())
+        from strands.multiagent import Swarm
+        params = self.swarm_params
         
         self.swarm = Swarm(
-            agent_list,
-            max_handoffs=swarm_config["max_handoffs"],
-            max_iterations=swarm_config["max_iterations"],
-            execution_timeout=swarm_config["execution_timeout"],
-            node_timeout=swarm_config["node_timeout"],
-            repetitive_handoff_detection_window=swarm_config["repetitive_handoff_detection_window"],
-            repetitive_handoff_min_unique_agents=swarm_config["repetitive_handoff_min_unique_agents"]
+            self._agent_list,
+            max_handoffs=params.max_handoffs,
+            max_iterations=params.max_iterations,
+            execution_timeout=params.execution_timeout,
+            node_timeout=params.node_timeout,
+            repetitive_handoff_detection_window=params.repetitive_handoff_detection_window,
+            repetitive_handoff_min_unique_agents=params.repetitive_handoff_min_unique_agents
         )
         
         logger.info("Multi-agent swarm created successfully!")
     
-    def execute_task(self, task: str) -> Any:
+    async def execute_task(self, task: str) -> Any:
         """Execute a task using the swarm"""
-        logger.info(f"🚀 Executing task: {task}")
+        logger.info("🚀 Executing task: %s", task)
         
         try:
-            result = self.swarm(task)
+            result = await self.swarm.invoke_async(task)
             
-            logger.info("✅ Task execution completed")
-            logger.info(f"📊 Status: {result.status}")
-            logger.info(f"🔄 Agent sequence: {[node.node_id for node in result.node_history]}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info("✅ Task execution completed")
+                logger.info(f"📊 Status: {result.status}")
+                logger.info(f"🔄 Agent sequence: {list(map(node_id, result.node_history))}")
             
             return result
         except Exception as e:
             logger.error(f"❌ Error executing task: {e}")
             raise
     
+    def close(self):
+        """Release the Ollama connections held by the swarm"""
+        if base.ollama_client is not None:
+            base.ollama_client.close()
+            base.ollama_client = None
+        if self.ollama_client is not None:
+            self.ollama_client.close()
+    
     def run_interactive_mode(self):
         """Run the swarm in interactive mode"""
         print("\n" + "="*70)
@@ -135,24 +229,27 @@ class MultiAgentSwarm:
         print("The Hynicl master will coordinate specialists to solve your tasks!")
         print("="*70)
         
+        # Command word -> handler, resolved with a single dict lookup per input
+        commands = {
+            'help': self.show_help,
+            'agents': self.show_agents,
+            'config': self.show_config,
+            'models': self.show_models,
+            'models refresh': lambda: self.show_models(refresh=True)
+        }
+        
         while True:
             try:
                 user_input = input("\n🎯 Task: ").strip()
+                command = user_input.lower()
                 
-                if user_input.lower() in ['quit', 'exit', 'q']:
+                if command in QUIT_COMMANDS:
                     print("👋 Swarm shutting down. Goodbye!")
                     break
                 
-                if user_input.lower() == 'help':
-                    self.show_help()
-                    continue
-                
-                if user_input.lower() == 'agents':
-                    self.show_agents()
-                    continue
-                
-                if user_input.lower() == 'config':
-                    self.show_config()
+                handler = commands.get(command)
+                if handler is not None:
+                    handler()
                     continue
                 
                 if not user_input:
@@ -161,10 +258,10 @@ class MultiAgentSwarm:
                 print(f"\n🚀 Hynicl Swarm processing: {user_input}")
                 print("-" * 60)
                 
-                result = self.execute_task(user_input)
+                result = asyncio.run(self.execute_task(user_input))
                 
                 print(f"\n✅ Task completed by Hynicl Swarm!")
-                print(f"📊 Agent flow: {' → '.join([node.node_id for node in result.node_history])}")
+                print(f"📊 Agent flow: {' → '.join(map(node_id, result.node_history))}")
                 print(f"🎯 Result:\n{result}")
                 
             except KeyboardInterrupt:
@@ -176,35 +273,47 @@ class MultiAgentSwarm:
     
     def show_help(self):
         """Show help information"""
-        print("\n📚 HYNICL SWARM COMMANDS:")
-        print("• Direct task description - Hynicl will coordinate agents automatically")
-        print("• 'agents' - Show available agents and roles")
-        print("• 'config' - Show current swarm configuration")  
-        print("• 'help' - Show this help message")
-        print("• 'quit' - Exit the swarm")
-        print("\n💡 EXAMPLE TASKS:")
-        print("• 'Research quantum computing and create a technical report'")
-        print("• 'Search for Python best practices and validate the information'")
-        print("• 'Analyze this dataset and implement visualization code'")
-        print("• 'Find information about AI ethics and reason through the implications'")
+        sys.stdout.write(self.HELP_TEXT)
     
     def show_agents(self):
         """Show available agents and their roles"""
-        print("\n🤖 HYNICL SWARM AGENTS:")
-        print("• HYNICL (Master): Coordinates swarm + domain expertise")
-        print("• SEARCH: Web search and information retrieval")
-        print("• REASONING: Logic analysis and decision making")  
-        print("• TOOL: Technical implementation and file operations")
-        print("• VALIDATION: Quality assurance and verification")
+        sys.stdout.write(self.AGENTS_TEXT)
     
     def show_config(self):
         """Show current configuration"""
-        print("\n⚙️ CURRENT CONFIGURATION:")
-        print(f"• Ollama Host: {self.config.config['ollama']['host']}")
-        print(f"• Model: {self.config.config['ollama']['default_model']}")
-        print(f"• Max Handoffs: {self.config.config['swarm']['max_handoffs']}")
-        print(f"• Max Iterations: {self.config.config['swarm']['max_iterations']}")
-        print(f"• Execution Timeout: {self.config.config['swarm']['execution_timeout']}s")
+        sys.stdout.write(self._config_text)
+    
+    def render_config(self) -> str:
+        """Render the configuration summary shown by the 'config' command"""
+        ollama_config = self.config.config['ollama']
+        swarm_config = self.config.config['swarm']
+        return "\n".join([
+            "\n⚙️ CURRENT CONFIGURATION:",
+            f"• Ollama Host: {ollama_config['host']}",
+            f"• Model: {ollama_config['default_model']}",
+            f"• Max Handoffs: {swarm_config['max_handoffs']}",
+            f"• Max Iterations: {swarm_config['max_iterations']}",
+            f"• Execution Timeout: {swarm_config['execution_timeout']}s"
+        ]) + "\n"
+    
+    def show_models(self, refresh: bool = False):
+        """Show models installed on the Ollama host"""
+        models = self.ollama_client.list_models(refresh=refresh)
+        if "error" in models:
+            print(f"❌ Error: {models['error']}")
+            return
+        
+        print("\n🧠 AVAILABLE MODELS:")
+        for model in models.get("models", []):
+            print(f"• {model['name']}")
+
+def install_uvloop():
+    """Run every event loop on uvloop when it is installed"""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
 
 def main():
     """Main function to initialize and run the swarm"""
@@ -214,6 +323,7 @@ def main():
         
         # Run interactive mode
         swarm.run_interactive_mode()
+        swarm.close()
         
     except Exception as e:
         logger.error(f"Error initializing swarm: {e}")
@@ -235,14 +345,19 @@ def test_swarm():
         
         for task in test_tasks:
             print(f"\n🔬 Testing: {task}")
-            result = swarm.execute_task(task)
+            result = asyncio.run(swarm.execute_task(task))
             print(f"✅ Result: {result}")
+        
+        swarm.close()
             
     except Exception as e:
         logger.error(f"Test failed: {e}")
         print(f"❌ Test failed: {e}")
 
 if __name__ == "__main__":
+    # Before the swarm starts its Ollama dispatcher loop
+    install_uvloop()
+    
     if len(sys.argv) > 1 and sys.argv[1] == "test":
         test_swarm()
     else:
@@ -0,0 +1,417 @@
+#!/usr/bin/env python3
+"""
+Ollama HTTP Clients
+
+Sync and asyncio clients for the Ollama REST API. Kept free of Strands
+imports and fully annotated so the module can be compiled on its own.
+"""
+
+import asyncio
+import itertools
+import logging
+import socket
+import sys
+import time
+from typing import Dict, Any, Optional, List, Iterator, AsyncIterator
+
+import aiohttp
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib.parse import urlparse
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+
+logger = logging.getLogger(__name__)
+
+class _FrameBuffer:
+    """Reassemble Ollama's NDJSON stream frames from raw network chunks"""
+    
+    def __init__(self) -> None:
+        self._buf = bytearray()
+    
+    def feed(self, data: bytes) -> Iterator[Dict[str, Any]]:
+        """Append a network chunk and yield every frame it completes"""
+        buf = self._buf
+        buf += data
+        start = 0
+        while True:
+            end = buf.find(b"\n", start)
+            if end < 0:
+                break
+            if end > start:
+                # Parse straight from the buffer - no per-line bytes copy
+                yield orjson.loads(memoryview(buf)[start:end])
+            start = end + 1
+        del buf[:start]
+    
+    def flush(self) -> Iterator[Dict[str, Any]]:
+        """Yield a final frame that was not newline-terminated"""
+        if self._buf.strip():
+            yield orjson.loads(self._buf)
+        self._buf.clear()
+
+class _KeepAliveAdapter(HTTPAdapter):
+    """HTTPAdapter whose sockets add TCP keep-alive to urllib3's default options"""
+    
+    # urllib3's defaults already disable Nagle (TCP_NODELAY); replacing them
+    # outright would drop that, so extend the list instead
+    SOCKET_OPTIONS = HTTPConnection.default_socket_options + [
+        (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    ]
+    
+    def init_poolmanager(self, *args: Any, **kwargs: Any) -> None:
+        kwargs["socket_options"] = self.SOCKET_OPTIONS
+        super().init_poolmanager(*args, **kwargs)
+
+class OllamaClient:
+    """Enhanced client for communicating with Ollama local model"""
+    
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.2:1b",
+                 models_ttl: float = 30.0):
+        self.base_url = base_url
+        self.model = model
+        
+        # Installed models change rarely, so /api/tags is cached for models_ttl seconds
+        self.models_ttl = models_ttl
+        self._models_cache: Optional[Dict[str, Any]] = None
+        self._models_cache_ts = 0.0
+        
+        # Pooled keep-alive session so each call reuses an open connection
+        self.session = requests.Session()
+        adapter = _KeepAliveAdapter(
+            pool_connections=4,
+            pool_maxsize=32,
+            max_retries=Retry(total=2, backoff_factor=0.1)
+        )
+        self.session.mount("http://", adapter)
+        
+        # Compressing small local responses costs more CPU than it saves
+        self.session.headers.update({
+            "Content-Type": "application/json",
+            "Connection": "keep-alive",
+            "Accept-Encoding": "identity"
+        })
+    
+    def close(self) -> None:
+        """Close the pooled HTTP session"""
+        self.session.close()
+    
+    def __enter__(self) -> "OllamaClient":
+        return self
+    
+    def __exit__(self, exc_type: Any, exc_value: Any, traceback: Any) -> None:
+        self.close()
+    
+    def __del__(self) -> None:
+        session = getattr(self, "session", None)
+        if session is not None:
+            session.close()
+    
+    def _stream(self, path: str, data: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+        """POST a streaming request and yield each NDJSON chunk"""
+        url = f"{self.base_url}{path}"
+        
+        frames = _FrameBuffer()
+        
+        # Connect timeout only - long completions keep streaming tokens
+        with self.session.post(url, data=orjson.dumps(data), stream=True, timeout=(5, None)) as response:
+            response.raise_for_status()
+            chunks = response.iter_content(chunk_size=None)
+            for raw in chunks:
+                for frame in frames.feed(raw):
+                    yield frame
+                    if frame.get("done"):
+                        # Stop parsing at the final frame, but still read the body
+                        # to its end - closing it unread would drop the keep-alive
+                        # socket instead of returning it to the pool
+                        for _ in chunks:
+                            pass
+                        return
+            yield from frames.flush()
+    
+    def generate(self, prompt: str) -> Dict[str, Any]:
+        """Generate response from Ollama model"""
+        data = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True
+        }
+        
+        try:
+            parts = []
+            chunk = {}
+            for chunk in self._stream("/api/generate", data):
+                if "error" in chunk:
+                    return {"error": chunk["error"]}
+                parts.append(chunk.get("response", ""))
+            
+            # Same shape as the non-streaming response: final stats + full text
+            chunk["response"] = "".join(parts)
+            return chunk
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error communicating with Ollama: {e}")
+            return {"error": str(e)}
+    
+    def generate_stream(self, prompt: str) -> Iterator[str]:
+        """Yield response tokens from Ollama model as they arrive"""
+        data = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True
+        }
+        
+        try:
+            for chunk in self._stream("/api/generate", data):
+                if "error" in chunk:
+                    logger.error(f"Error from Ollama: {chunk['error']}")
+                    return
+                token = chunk.get("response")
+                if token:
+                    yield token
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error communicating with Ollama: {e}")
+    
+    def chat(self, messages: list) -> Dict[str, Any]:
+        """Chat with Ollama model using message history"""
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True
+        }
+        
+        try:
+            parts = []
+            chunk = {}
+            for chunk in self._stream("/api/chat", data):
+                if "error" in chunk:
+                    return {"error": chunk["error"]}
+                parts.append(chunk.get("message", {}).get("content", ""))
+            
+            chunk["message"] = {"role": "assistant", "content": "".join(parts)}
+            return chunk
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error communicating with Ollama: {e}")
+            return {"error": str(e)}
+    
+    def embed(self, inputs: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        """Embed one or more inputs in a single /api/embed call"""
+        url = f"{self.base_url}/api/embed"
+        data = {
+            "model": model or self.model,
+            "input": inputs
+        }
+        
+        try:
+            response = self.session.post(url, data=orjson.dumps(data))
+            response.raise_for_status()
+            return orjson.loads(response.content)
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error embedding with Ollama: {e}")
+            return {"error": str(e)}
+    
+    def list_models(self, refresh: bool = False) -> Dict[str, Any]:
+        """List available Ollama models, served from cache unless stale or refreshed"""
+        if (not refresh and self._models_cache is not None
+                and time.monotonic() - self._models_cache_ts < self.models_ttl):
+            return self._models_cache
+        
+        url = f"{self.base_url}/api/tags"
+        
+        try:
+            response = self.session.get(url)
+            response.raise_for_status()
+            self._models_cache = orjson.loads(response.content)
+            self._models_cache_ts = time.monotonic()
+            return self._models_cache
+        except (requests.exceptions.RequestException, orjson.JSONDecodeError) as e:
+            logger.error(f"Error listing models: {e}")
+            return {"error": str(e)}
+
+class AsyncOllamaClient:
+    """Asyncio client for Ollama so concurrent swarm calls overlap instead of serializing"""
+    
+    def __init__(self, base_url: str = "http://localhost:11434", model: str = "llama3.2:1b",
+                 connection_limit: int = 32, unix_socket: Optional[str] = None):
+        self.base_url = base_url
+        self.model = model
+        self.connection_limit = connection_limit
+        self.unix_socket = unix_socket
+        self.session: Optional[aiohttp.ClientSession] = None
+    
+    def _make_connector(self) -> aiohttp.BaseConnector:
+        if self.unix_socket:
+            # Skips loopback TCP entirely when Ollama is reachable over a socket file
+            return aiohttp.UnixConnector(path=self.unix_socket, limit=self.connection_limit, keepalive_timeout=600)
+        
+        return aiohttp.TCPConnector(
+            limit=self.connection_limit,
+            keepalive_timeout=600,
+            ttl_dns_cache=300,
+            use_dns_cache=True,
+            # Only needed before CPython fixed leaked SSL transports (3.12.7)
+            enable_cleanup_closed=sys.version_info < (3, 12, 7)
+        )
+    
+    def _get_session(self) -> aiohttp.ClientSession:
+        # Created lazily so the session binds to the event loop that uses it
+        if self.session is None or self.session.closed:
+            self.session = aiohttp.ClientSession(
+                connector=self._make_connector(),
+                headers={"Content-Type": "application/json", "Accept-Encoding": "identity"},
+                timeout=aiohttp.ClientTimeout(total=None, sock_connect=5)
+            )
+        return self.session
+    
+    async def close(self) -> None:
+        """Close the pooled HTTP session"""
+        if self.session is not None:
+            await self.session.close()
+    
+    async def _stream(self, path: str, data: Dict[str, Any]) -> AsyncIterator[Dict[str, Any]]:
+        """POST a streaming request and yield each NDJSON chunk"""
+        url = f"{self.base_url}{path}"
+        
+        frames = _FrameBuffer()
+        
+        async with self._get_session().post(url, data=orjson.dumps(data)) as response:
+            response.raise_for_status()
+            chunks = response.content.iter_any()
+            async for raw in chunks:
+                for frame in frames.feed(raw):
+                    yield frame
+                    if frame.get("done"):
+                        # Same as the sync client: skip trailing frames but leave
+                        # the connection fully read so aiohttp can reuse it
+                        async for _ in chunks:
+                            pass
+                        return
+            for frame in frames.flush():
+                yield frame
+    
+    async def generate(self, prompt: str) -> Dict[str, Any]:
+        """Generate response from Ollama model"""
+        data = {
+            "model": self.model,
+            "prompt": prompt,
+            "stream": True
+        }
+        
+        try:
+            parts = []
+            chunk = {}
+            async for chunk in self._stream("/api/generate", data):
+                if "error" in chunk:
+                    return {"error": chunk["error"]}
+                parts.append(chunk.get("response", ""))
+            
+            chunk["response"] = "".join(parts)
+            return chunk
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error communicating with Ollama: {e}")
+            return {"error": str(e)}
+    
+    async def chat(self, messages: list) -> Dict[str, Any]:
+        """Chat with Ollama model using message history"""
+        data = {
+            "model": self.model,
+            "messages": messages,
+            "stream": True
+        }
+        
+        try:
+            parts = []
+            chunk = {}
+            async for chunk in self._stream("/api/chat", data):
+                if "error" in chunk:
+                    return {"error": chunk["error"]}
+                parts.append(chunk.get("message", {}).get("content", ""))
+            
+            chunk["message"] = {"role": "assistant", "content": "".join(parts)}
+            return chunk
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error communicating with Ollama: {e}")
+            return {"error": str(e)}
+    
+    async def embed(self, inputs: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        """Embed one or more inputs in a single /api/embed call"""
+        url = f"{self.base_url}/api/embed"
+        data = {
+            "model": model or self.model,
+            "input": inputs
+        }
+        
+        try:
+            async with self._get_session().post(url, data=orjson.dumps(data)) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error embedding with Ollama: {e}")
+            return {"error": str(e)}
+    
+    async def list_models(self) -> Dict[str, Any]:
+        """List available Ollama models"""
+        url = f"{self.base_url}/api/tags"
+        
+        try:
+            async with self._get_session().get(url) as response:
+                response.raise_for_status()
+                return orjson.loads(await response.read())
+        except (aiohttp.ClientError, orjson.JSONDecodeError) as e:
+            logger.error(f"Error listing models: {e}")
+            return {"error": str(e)}
+
+
+class OllamaSemaphorePool:
+    """Per-endpoint concurrency limits - tight for a local GPU, looser for remote hosts"""
+    
+    LOCAL_HOSTS = ("localhost", "127.0.0.1", "::1")
+    
+    def __init__(self, local_limit: int = 1, remote_limit: int = 4):
+        self.local_limit = local_limit
+        self.remote_limit = remote_limit
+        self._semaphores: Dict[str, asyncio.Semaphore] = {}
+    
+    def get(self, base_url: str) -> asyncio.Semaphore:
+        """Return the semaphore guarding an endpoint"""
+        semaphore = self._semaphores.get(base_url)
+        if semaphore is None:
+            is_local = urlparse(base_url).hostname in self.LOCAL_HOSTS
+            semaphore = asyncio.Semaphore(self.local_limit if is_local else self.remote_limit)
+            self._semaphores[base_url] = semaphore
+        return semaphore
+
+
+class RoundRobinOllama:
+    """Spread Ollama calls across several hosts in turn"""
+    
+    def __init__(self, clients: List[AsyncOllamaClient], semaphores: Optional[OllamaSemaphorePool] = None):
+        self.clients = clients
+        self.model = clients[0].model
+        self.semaphores = semaphores or OllamaSemaphorePool()
+        self._next_client = itertools.cycle(clients)
+    
+    async def _call(self, method: str, *args: Any) -> Dict[str, Any]:
+        client = next(self._next_client)
+        async with self.semaphores.get(client.base_url):
+            return await getattr(client, method)(*args)
+    
+    async def generate(self, prompt: str) -> Dict[str, Any]:
+        """Generate response on the next host"""
+        return await self._call("generate", prompt)
+    
+    async def chat(self, messages: list) -> Dict[str, Any]:
+        """Chat on the next host"""
+        return await self._call("chat", messages)
+    
+    async def embed(self, inputs: List[str], model: Optional[str] = None) -> Dict[str, Any]:
+        """Embed inputs on the next host"""
+        return await self._call("embed", inputs, model)
+    
+    async def list_models(self) -> Dict[str, Any]:
+        """List models available on the next host"""
+        return await self._call("list_models")
+    
+    async def close(self) -> None:
+        """Close every host's session"""
+        await asyncio.gather(*(client.close() for client in self.clients))
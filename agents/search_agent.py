@@ -4,15 +4,13 @@ Search Agent - Web Search and Information Retrieval Specialist
 """
 
 import logging
-import os
-import yaml
+from typing import TYPE_CHECKING, Any, Tuple
 
-from strands import Agent
-from strands_tools import memory
-from base import BaseAgent, web_search, ollama_query
-config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-with open(config_path, 'r') as file:
-    config = yaml.safe_load(file)   
+from .base import BaseAgent
+from .swarm_config import get_prompt
+
+if TYPE_CHECKING:
+    from strands import Agent
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +20,23 @@ class SearchAgent(BaseAgent):
     def __init__(self, ollama_model):
         super().__init__("search", ollama_model)
     
-    def create_agent(self) -> Agent:
+    @classmethod
+    def load_tools(cls) -> Tuple[Any, ...]:
+        """Import the Strands tools this agent registers"""
+        from strands_tools import memory
+        from .swarm_tools import web_search, ollama_query
+        
+        return (
+            web_search,       # Primary search capability
+            memory,           # Shared memory access
+            ollama_query      # AI assistance for search optimization
+        )
+    
+    def create_agent(self) -> "Agent":
         """Create the Search Specialist Agent"""
+        from strands import Agent
         
-        system_prompt = config['Prompt']['search_agent_prompt']
+        system_prompt = get_prompt(self.name)
 
 
 
@@ -33,11 +44,7 @@ class SearchAgent(BaseAgent):
             name=self.name,
             model=self.ollama_model,
             system_prompt=system_prompt,
-            tools=[
-                web_search,       # Primary search capability
-                memory,           # Shared memory access
-                ollama_query      # AI assistance for search optimization
-            ]
+            tools=list(self.get_tools())
         )
 
 # Factory function
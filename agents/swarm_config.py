@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Swarm Configuration Access
+
+The config is frozen on load (see yaml_config.freeze), so the single shared
+instance cannot be changed by one caller under another. `CONFIG` (the
+agents' PromptConfig) resolves on first access, keeping `import swarm_config`
+free of any parsing.
+
+When build_config.py has baked config.yml into _config_generated.py, that
+module is used instead of YAML as long as it matches config.yml's contents.
+Set AGENTS_DEV=1 to always read config.yml.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Any, Dict, Mapping, Optional
+
+from .yaml_config import freeze, load_config, source_hash
+
+logger = logging.getLogger(__name__)
+
+# Default to config.yml in the project root (parent of agents directory)
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
+
+# Prompt keys in config.yml are '<agent name>_agent_prompt'
+PROMPT_SUFFIX = "_agent_prompt"
+
+@dataclass(slots=True, frozen=True)
+class PromptConfig:
+    """System prompts unpacked once from the 'Prompt' config section"""
+    hynicl: str
+    search: str
+    reasoning: str
+    tool: str
+    validation: str
+
+    @classmethod
+    def from_config(cls, prompt_config: Mapping[str, str]) -> "PromptConfig":
+        """Build from the 'Prompt' section of config.yml"""
+        return cls(
+            hynicl=prompt_config["hynicl" + PROMPT_SUFFIX],
+            search=prompt_config["search" + PROMPT_SUFFIX],
+            reasoning=prompt_config["reasoning" + PROMPT_SUFFIX],
+            tool=prompt_config["tool" + PROMPT_SUFFIX],
+            validation=prompt_config["validation" + PROMPT_SUFFIX]
+        )
+
+def _load_generated() -> Optional[Dict[str, Any]]:
+    """Config baked by build_config.py, if present and built from config.yml"""
+    if os.environ.get("AGENTS_DEV") == "1":
+        return None
+    try:
+        from . import _config_generated
+    except ImportError:
+        return None
+    
+    try:
+        with open(CONFIG_PATH, 'rb') as f:
+            source = f.read()
+    except FileNotFoundError:
+        # Deployed without the YAML source - the generated module is the config
+        return _config_generated.CONFIG
+    
+    if source_hash(source) != _config_generated.SOURCE_HASH:
+        logger.warning("_config_generated.py is out of date with config.yml; rerun build_config.py")
+        return None
+    return _config_generated.CONFIG
+
+@lru_cache(maxsize=1)
+def get_config() -> Mapping[str, Any]:
+    """Return the project config.yml, parsed and frozen on first use"""
+    config = _load_generated()
+    if config is None:
+        return load_config(CONFIG_PATH)
+    return freeze(config)
+
+@lru_cache(maxsize=1)
+def get_prompts() -> PromptConfig:
+    """The agents' system prompts, built once"""
+    return PromptConfig.from_config(get_config()['Prompt'])
+
+def get_prompt(name: str) -> str:
+    """System prompt for the agent called `name`"""
+    return getattr(get_prompts(), name)
+
+def __getattr__(name: str) -> Any:
+    """Resolve CONFIG lazily so importing this module never parses YAML"""
+    if name == "CONFIG":
+        return get_prompts()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Strands Tools Shared by the Swarm Agents
+
+Kept out of base.py so that importing base (or an agent module) does not load
+Strands; the agents import these inside create_agent.
+"""
+
+from strands import tool
+
+from . import base
+
+@tool
+async def ollama_query(prompt: str, use_chat: bool = False) -> str:
+    """
+    Query the Ollama model with a prompt
+    
+    Args:
+        prompt: The prompt to send to the model
+        use_chat: Whether to use chat format or generate format
+    
+    Returns:
+        str: The model's response
+    """
+    # Read per call: main.py installs both after this module may be imported
+    client = base.ollama_client
+    cache = base.ollama_cache
+    
+    embedding = None
+    if cache is not None:
+        cached = cache.get(client.model, prompt, use_chat)
+        
+        # Only pay for an embedding once the exact-match tier has missed
+        if cached is None and cache.semantic:
+            embedded = await client.embed([prompt], model=cache.embed_model)
+            if "error" not in embedded:
+                embedding = embedded["embeddings"][0]
+                cached = cache.get(client.model, prompt, use_chat, embedding)
+        
+        if cached is not None:
+            return cached
+    
+    if use_chat:
+        messages = [{"role": "user", "content": prompt}]
+        result = await client.chat(messages)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        response = result.get("message", {}).get("content", "No response received")
+    else:
+        result = await client.generate(prompt)
+        if "error" in result:
+            return f"Error: {result['error']}"
+        response = result.get("response", "No response received")
+    
+    if cache is not None:
+        cache.put(client.model, prompt, use_chat, response, embedding)
+    return response
+
+@tool
+def web_search(query: str) -> str:
+    """Simulate web search functionality"""
+    return f"Search results for '{query}': [Simulated search results would appear here]"
+
+@tool  
+def code_execution(code: str, language: str = "python") -> str:
+    """Execute code safely in a sandboxed environment"""
+    return f"Code execution result: [Simulated execution of {language} code]"
@@ -4,15 +4,13 @@ Tool Agent - Technical Operations and Implementation Specialist
 """
 
 import logging
-import os
-import yaml
+from typing import TYPE_CHECKING, Any, Tuple
 
-from strands import Agent
-from strands_tools import file_read, file_write, editor, calculator, memory
-from base import BaseAgent, code_execution, ollama_query
-config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-with open(config_path, 'r') as file:
-    config = yaml.safe_load(file)   
+from .base import BaseAgent
+from .swarm_config import get_prompt
+
+if TYPE_CHECKING:
+    from strands import Agent
 
 logger = logging.getLogger(__name__)
 
@@ -22,10 +20,27 @@ class ToolAgent(BaseAgent):
     def __init__(self, ollama_model):
         super().__init__("tool", ollama_model)
     
-    def create_agent(self) -> Agent:
+    @classmethod
+    def load_tools(cls) -> Tuple[Any, ...]:
+        """Import the Strands tools this agent registers"""
+        from strands_tools import file_read, file_write, editor, calculator, memory
+        from .swarm_tools import code_execution, ollama_query
+        
+        return (
+            file_read,        # File operations
+            file_write,
+            editor,
+            calculator,       # Computational tools
+            code_execution,   # Code execution
+            memory,           # Shared memory
+            ollama_query      # AI assistance for technical problems
+        )
+    
+    def create_agent(self) -> "Agent":
         """Create the Tool Specialist Agent"""
+        from strands import Agent
         
-        system_prompt = config['Prompt']['tool_agent_prompt']
+        system_prompt = get_prompt(self.name)
 
 
 
@@ -34,15 +49,7 @@ class ToolAgent(BaseAgent):
             name=self.name,
             model=self.ollama_model,
             system_prompt=system_prompt,
-            tools=[
-                file_read,        # File operations
-                file_write,
-                editor,
-                calculator,       # Computational tools
-                code_execution,   # Code execution
-                memory,           # Shared memory
-                ollama_query      # AI assistance for technical problems
-            ]
+            tools=list(self.get_tools())
         )
 
 # Factory function
@@ -4,15 +4,13 @@ Validation Agent - Quality Assurance and Verification Specialist
 """
 
 import logging
-import os
-import yaml
+from typing import TYPE_CHECKING, Any, Tuple
 
-from strands import Agent
-from strands_tools import memory, file_read
-from base import BaseAgent, ollama_query
-config_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'config.yml')
-with open(config_path, 'r') as file:
-    config = yaml.safe_load(file)   
+from .base import BaseAgent
+from .swarm_config import get_prompt
+
+if TYPE_CHECKING:
+    from strands import Agent
 
 logger = logging.getLogger(__name__)
 
@@ -22,21 +20,30 @@ class ValidationAgent(BaseAgent):
     def __init__(self, ollama_model):
         super().__init__("validation", ollama_model)
     
-    def create_agent(self) -> Agent:
+    @classmethod
+    def load_tools(cls) -> Tuple[Any, ...]:
+        """Import the Strands tools this agent registers"""
+        from strands_tools import memory, file_read
+        from .swarm_tools import ollama_query
+        
+        return (
+            memory,           # Access to shared work for validation
+            file_read,        # Review files and documents
+            ollama_query      # AI assistance for validation criteria
+        )
+    
+    def create_agent(self) -> "Agent":
         """Create the Validation Specialist Agent"""
+        from strands import Agent
         
-        system_prompt = config['Prompt']['validation_agent_prompt']
+        system_prompt = get_prompt(self.name)
 
 
         return Agent(
             name=self.name,
             model=self.ollama_model,
             system_prompt=system_prompt,
-            tools=[
-                memory,           # Access to shared work for validation
-                file_read,        # Review files and documents
-                ollama_query      # AI assistance for validation criteria
-            ]
+            tools=list(self.get_tools())
         )
 
 # Factory function
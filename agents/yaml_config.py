@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+YAML Config Loading
+
+Parsed configs are mirrored to a JSON sidecar next to the YAML file
+(config.yml -> config.cache.json) so warm starts skip YAML parsing, and
+PyYAML itself is only imported when a file actually has to be parsed.
+The sidecar is keyed on a hash of the YAML bytes rather than mtimes, so
+checkouts and copies that reset timestamps cannot serve a stale config.
+The returned config is shared by every caller, so it is frozen: mappings
+become read-only MappingProxyType views and lists become tuples.
+"""
+
+import hashlib
+import logging
+import os
+import tempfile
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+def get_loader() -> Any:
+    """libyaml's C parser when available, pure-Python otherwise"""
+    import yaml
+    return getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+def freeze(value: Any) -> Any:
+    """Recursively convert dicts and lists to read-only equivalents"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(freeze(item) for item in value)
+    return value
+
+def source_hash(source: bytes) -> str:
+    """Content hash identifying one version of a YAML file"""
+    return hashlib.blake2b(source, digest_size=16).hexdigest()
+
+def cache_path(config_path: str) -> str:
+    """Path of the JSON sidecar for a YAML config file"""
+    return os.path.splitext(config_path)[0] + ".cache.json"
+
+def _read_cache(sidecar: str, digest: str) -> Any:
+    """Return the cached config if it was built from YAML with this hash"""
+    try:
+        with open(sidecar, 'rb') as f:
+            cached = orjson.loads(f.read())
+    except (OSError, orjson.JSONDecodeError):
+        return None
+    if not isinstance(cached, dict) or cached.get("source_hash") != digest:
+        return None
+    return cached.get("config")
+
+def _write_cache(sidecar: str, digest: str, config: Dict[str, Any]) -> None:
+    """Atomically replace the sidecar; a read-only tree just skips the cache"""
+    tmp_path = None
+    try:
+        # Unique per writer: the prewarm thread and the main thread may both miss
+        fd, tmp_path = tempfile.mkstemp(
+            prefix=os.path.basename(sidecar) + ".", suffix=".tmp", dir=os.path.dirname(sidecar)
+        )
+        with os.fdopen(fd, 'wb') as f:
+            f.write(orjson.dumps({"source_hash": digest, "config": config}))
+        os.replace(tmp_path, sidecar)
+    except (OSError, TypeError) as e:
+        logger.debug(f"Not caching config to {sidecar}: {e}")
+        if tmp_path is not None:
+            try:
+                os.remove(tmp_path)
+            except OSError:
+                pass
+
+@lru_cache(maxsize=None)
+def load_config(config_path: str) -> Mapping[str, Any]:
+    """Parse a YAML config file once and share a frozen copy across the process"""
+    # One read serves both the hash check and, on a miss, the parse
+    with open(config_path, 'rb') as f:
+        source = f.read()
+    digest = source_hash(source)
+    
+    sidecar = cache_path(config_path)
+    config = _read_cache(sidecar, digest)
+    if config is not None:
+        return freeze(config)
+
+    import yaml
+    config = yaml.load(source, Loader=get_loader())
+    _write_cache(sidecar, digest, config)
+    return freeze(config)
@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""
+Tests for BatchingOllamaClient cancellation handling
+"""
+
+import asyncio
+import os
+import sys
+import threading
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base import BatchingOllamaClient
+
+class FakeBackend:
+    """Stands in for AsyncOllamaClient; 'slow' prompts block until cancelled"""
+
+    model = "fake-model"
+
+    def __init__(self, embed_delay: float = 0.2):
+        self.embed_delay = embed_delay
+        self.embed_calls = 0
+        self.cancelled = threading.Event()
+
+    async def generate(self, prompt):
+        if prompt == "slow":
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                self.cancelled.set()
+                raise
+        return {"response": prompt}
+
+    async def embed(self, inputs, model=None):
+        self.embed_calls += 1
+        try:
+            await asyncio.sleep(self.embed_delay)
+        except asyncio.CancelledError:
+            self.cancelled.set()
+            raise
+        return {"embeddings": [[float(len(text))] for text in inputs]}
+
+    async def close(self):
+        pass
+
+class BatchingCancellationTest(unittest.TestCase):
+
+    def make_client(self, backend, **kwargs):
+        client = BatchingOllamaClient(backend, **kwargs)
+        errors = []
+        client._loop.call_soon_threadsafe(
+            client._loop.set_exception_handler, lambda loop, context: errors.append(context)
+        )
+        self.addCleanup(client.close)
+        return client, errors
+
+    def test_cancelled_call_cancels_backend_request(self):
+        backend = FakeBackend()
+        client, errors = self.make_client(backend, max_batch_size=1, max_wait=0)
+
+        async def scenario():
+            with self.assertRaises(asyncio.TimeoutError):
+                await asyncio.wait_for(client.generate("slow"), 0.1)
+            # The abandoned request must not hold up the next one
+            return await asyncio.wait_for(client.generate("next"), 2)
+
+        self.assertEqual(asyncio.run(scenario()), {"response": "next"})
+        self.assertTrue(backend.cancelled.wait(2))
+        self.assertEqual(errors, [])
+
+    def test_cancelled_embed_caller_does_not_strand_batch(self):
+        backend = FakeBackend()
+        client, errors = self.make_client(backend, max_batch_size=8, max_wait=0.02)
+
+        async def scenario():
+            first = asyncio.ensure_future(client.embed(["a"]))
+            second = asyncio.ensure_future(client.embed(["bb"]))
+            third = asyncio.ensure_future(client.embed(["ccc"]))
+            # Let the batch form and reach the backend, then abandon one caller
+            await asyncio.sleep(0.1)
+            first.cancel()
+            return await asyncio.wait_for(asyncio.gather(second, third), 2)
+
+        second, third = asyncio.run(scenario())
+        self.assertEqual(second["embeddings"], [[2.0]])
+        self.assertEqual(third["embeddings"], [[3.0]])
+        self.assertEqual(backend.embed_calls, 1)
+        self.assertFalse(backend.cancelled.is_set())
+        self.assertEqual(errors, [])
+
+    def test_embed_batch_cancelled_when_every_caller_gives_up(self):
+        backend = FakeBackend(embed_delay=10)
+        client, errors = self.make_client(backend, max_batch_size=8, max_wait=0.02)
+
+        async def scenario():
+            callers = [asyncio.ensure_future(client.embed([text])) for text in ("a", "b")]
+            await asyncio.sleep(0.1)
+            for caller in callers:
+                caller.cancel()
+            await asyncio.gather(*callers, return_exceptions=True)
+
+        asyncio.run(scenario())
+        self.assertTrue(backend.cancelled.wait(2))
+        self.assertEqual(errors, [])
+
+    def test_malformed_embed_response_fails_callers(self):
+        backend = FakeBackend(embed_delay=0)
+
+        async def no_embeddings(inputs, model=None):
+            return {"model": backend.model}
+
+        backend.embed = no_embeddings
+        client, errors = self.make_client(backend, max_batch_size=8, max_wait=0.02)
+
+        async def scenario():
+            callers = [client.embed([text]) for text in ("a", "b")]
+            return await asyncio.wait_for(asyncio.gather(*callers, return_exceptions=True), 2)
+
+        results = asyncio.run(scenario())
+        self.assertEqual([type(result) for result in results], [KeyError, KeyError])
+        self.assertEqual(errors, [])
+
+if __name__ == "__main__":
+    unittest.main()
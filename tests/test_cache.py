@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+"""
+Tests for OllamaCache exact and semantic lookups
+"""
+
+import os
+import sys
+import unittest
+from unittest import mock
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from agents.base import OllamaCache
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+MODEL = "fake-model"
+
+class FakeClock:
+    """Stands in for time.monotonic so TTL expiry needs no sleeping"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+class CacheTestCase(unittest.TestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch("agents.base.time.monotonic", self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+class ExactCacheTest(CacheTestCase):
+
+    def test_exact_hit(self):
+        cache = OllamaCache()
+        cache.put(MODEL, "hello", False, "world")
+        self.assertEqual(cache.get(MODEL, "hello", False), "world")
+        self.assertIsNone(cache.get(MODEL, "hello!", False))
+        self.assertIsNone(cache.get("other-model", "hello", False))
+
+    def test_lru_eviction(self):
+        cache = OllamaCache(max_entries=2)
+        cache.put(MODEL, "a", False, "A")
+        cache.put(MODEL, "b", False, "B")
+        # Touching "a" makes "b" the least recently used entry
+        self.assertEqual(cache.get(MODEL, "a", False), "A")
+        cache.put(MODEL, "c", False, "C")
+
+        self.assertIsNone(cache.get(MODEL, "b", False))
+        self.assertEqual(cache.get(MODEL, "a", False), "A")
+        self.assertEqual(cache.get(MODEL, "c", False), "C")
+
+    def test_ttl_expiry(self):
+        cache = OllamaCache(ttl=60)
+        cache.put(MODEL, "hello", False, "world")
+        self.clock.now += 60
+        self.assertEqual(cache.get(MODEL, "hello", False), "world")
+        self.clock.now += 1
+        self.assertIsNone(cache.get(MODEL, "hello", False))
+
+    def test_use_chat_is_part_of_the_key(self):
+        cache = OllamaCache()
+        cache.put(MODEL, "hello", True, "chat reply")
+        self.assertIsNone(cache.get(MODEL, "hello", False))
+        self.assertEqual(cache.get(MODEL, "hello", True), "chat reply")
+
+@unittest.skipIf(numpy is None, "numpy is not installed")
+class SemanticCacheTest(CacheTestCase):
+
+    def make_cache(self, **kwargs):
+        cache = OllamaCache(semantic=True, similarity_threshold=0.9, **kwargs)
+        self.assertTrue(cache.semantic)
+        return cache
+
+    def test_similar_prompt_hits(self):
+        cache = self.make_cache()
+        cache.put(MODEL, "what is 2+2", False, "4", embedding=[1.0, 0.0])
+        self.assertEqual(cache.get(MODEL, "what's 2+2?", False, embedding=[0.99, 0.05]), "4")
+
+    def test_threshold_cut_off(self):
+        cache = self.make_cache()
+        cache.put(MODEL, "what is 2+2", False, "4", embedding=[1.0, 0.0])
+        # cos(45 degrees) ~= 0.71, well below the 0.9 threshold
+        self.assertIsNone(cache.get(MODEL, "capital of France", False, embedding=[1.0, 1.0]))
+
+    def test_scope_split(self):
+        cache = self.make_cache()
+        cache.put(MODEL, "what is 2+2", False, "4", embedding=[1.0, 0.0])
+        self.assertIsNone(cache.get(MODEL, "what's 2+2?", True, embedding=[1.0, 0.0]))
+        self.assertIsNone(cache.get("other-model", "what's 2+2?", False, embedding=[1.0, 0.0]))
+
+    def test_expired_best_match_falls_back_to_fresh_entry(self):
+        cache = self.make_cache(ttl=60)
+        cache.put(MODEL, "stale", False, "old", embedding=[1.0, 0.0])
+        self.clock.now += 30
+        cache.put(MODEL, "fresh", False, "new", embedding=[0.95, 0.1])
+        self.clock.now += 31
+
+        # "stale" is the closer match but has expired
+        self.assertEqual(cache.get(MODEL, "query", False, embedding=[1.0, 0.0]), "new")
+
+    def test_all_expired_is_a_miss(self):
+        cache = self.make_cache(ttl=60)
+        cache.put(MODEL, "stale", False, "old", embedding=[1.0, 0.0])
+        self.clock.now += 61
+        self.assertIsNone(cache.get(MODEL, "query", False, embedding=[1.0, 0.0]))
+
+if __name__ == "__main__":
+    unittest.main()